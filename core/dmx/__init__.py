@@ -30,13 +30,13 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from dmx.colour import Colour
-from dmx.drivers import DMXDriver, get_drivers
+from dmx.colour import Colour, ColourBuffer
+from dmx.drivers import DMXDriver, get_driver, get_drivers
 from dmx.interface import DMXInterface
 from dmx.light import DMXLight, DMXLight3Slot, DMXLight7Slot
 from dmx.universe import DMXUniverse
 
 __all__ = [
-    "Colour", "DMXDriver", "get_drivers", "DMXInterface", "DMXLight", "DMXLight3Slot",
-    "DMXLight7Slot", "DMXUniverse"
+    "Colour", "ColourBuffer", "DMXDriver", "get_driver", "get_drivers", "DMXInterface",
+    "DMXLight", "DMXLight3Slot", "DMXLight7Slot", "DMXUniverse"
 ]
@@ -30,25 +30,41 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import List, Union
+from operator import add, floordiv, mul, or_, sub, truediv
+from typing import Callable, Optional, Sequence, Union
+
+from dmx.constants import DMX_MAX_ADDRESS, DMX_MIN_ADDRESS
+from dmx.util import clamp_byte
 
 
 class Colour:
-    """Represents a colour in 24 bit RGB."""
+    """Represents a colour in 24 bit RGB.
+
+    Arithmetic with another colour or a number gives a new colour, with each
+    component clamped between 0 and 255 (inclusive).
+    """
+
+    __slots__ = ("_red", "_green", "_blue", "_cache")
 
     def __init__(self, red: int, green: int, blue: int):
-        """Initialise the colour."""
-        self._red = red
-        self._green = green
-        self._blue = blue
+        """Initialise the colour, clamping each component between 0 and 255 (inclusive)."""
+        # components are clamped here as well as in the setters so that every
+        # colour can be serialised (and cached) as bytes
+        self._red = clamp_byte(red)
+        self._green = clamp_byte(green)
+        self._blue = clamp_byte(blue)
+        self._cache = None  # type: Optional[bytes]
 
-    def serialise(self) -> List[int]:
+    def serialise(self) -> bytes:
         """Serialise the colour in RGB order to a sequence of bytes."""
-        return [self._red, self._green, self._blue]
+        # lights serialise their colour every frame but colours rarely change,
+        # so keep the bytes around until one of the components is set
+        if self._cache is None:
+            self._cache = bytes((self._red, self._green, self._blue))
+        return self._cache
 
-    def serialize(self, *args, **kwargs) -> List[int]:
-        """Alias of `serialise`."""
-        return self.serialise(*args, **kwargs)
+    # Alias of `serialise`.
+    serialize = serialise
 
     @property
     def red(self) -> int:
@@ -58,7 +74,8 @@ class Colour:
     @red.setter
     def red(self, value: int):
         """Set red component."""
-        self._red = int(max(0, min(value, 255)))
+        self._red = clamp_byte(value)
+        self._cache = None
 
     @property
     def green(self) -> int:
@@ -68,72 +85,178 @@ class Colour:
     @green.setter
     def green(self, value: int):
         """Set green component."""
-        self._green = int(max(0, min(value, 255)))
+        self._green = clamp_byte(value)
+        self._cache = None
 
     @property
     def blue(self) -> int:
         """Get blue component."""
-        return self._red
+        return self._blue
 
     @blue.setter
     def blue(self, value: int):
         """Set blue component."""
-        self._blue = int(max(0, min(value, 255)))
+        self._blue = clamp_byte(value)
+        self._cache = None
 
-    def __add__(self, other: Union['Colour', int, float]):
-        """Handle add."""
+    def _apply(self, operation: Callable[[float, float], float],
+               other: Union['Colour', int, float]) -> 'Colour':
+        """Apply an operation to all three components, giving a new clamped colour."""
         if isinstance(other, Colour):
-            self.red += other.red
-            self.green += other.green
-            self.blue += other.blue
+            red, green, blue = other._red, other._green, other._blue
         elif isinstance(other, (int, float)):
-            self.red = int(self.red + other)
-            self.green = int(self.green + other)
-            self.blue = int(self.blue + other)
+            red = green = blue = other
+        else:
+            return NotImplemented
+
+        return Colour(clamp_byte(operation(self._red, red)),
+                      clamp_byte(operation(self._green, green)),
+                      clamp_byte(operation(self._blue, blue)))
 
-    def __sub__(self, other: Union['Colour', int, float]):
+    def __add__(self, other: Union['Colour', int, float]) -> 'Colour':
+        """Handle add."""
+        return self._apply(add, other)
+
+    def __sub__(self, other: Union['Colour', int, float]) -> 'Colour':
         """Handle subtract."""
-        if isinstance(other, Colour):
-            self.red -= other.red
-            self.green -= other.green
-            self.blue -= other.blue
-        elif isinstance(other, (int, float)):
-            self.red = int(self.red - other)
-            self.green = int(self.green - other)
-            self.blue = int(self.blue - other)
+        return self._apply(sub, other)
 
-    def __mul__(self, other: Union['Colour', int, float]):
+    def __mul__(self, other: Union['Colour', int, float]) -> 'Colour':
         """Handle multiply."""
-        if isinstance(other, Colour):
-            self.red *= other.red
-            self.green *= other.green
-            self.blue *= other.blue
-        elif isinstance(other, (int, float)):
-            self.red = int(self.red * other)
-            self.green = int(self.green * other)
-            self.blue = int(self.blue * other)
+        return self._apply(mul, other)
 
-    def __truediv__(self, other: Union['Colour', int, float]):
+    def __truediv__(self, other: Union['Colour', int, float]) -> 'Colour':
         """Handle division."""
-        if isinstance(other, Colour):
-            self.red = int(self.red / other.red)
-            self.green = int(self.green / other.green)
-            self.blue = int(self.blue / other.blue)
-        elif isinstance(other, (int, float)):
-            self.red = int(self.red / other)
-            self.green = int(self.green / other)
-            self.blue = int(self.blue / other)
+        return self._apply(truediv, other)
 
-    def __floordiv__(self, other: Union['Colour', int, float]):
+    def __floordiv__(self, other: Union['Colour', int, float]) -> 'Colour':
         """Handle floor division."""
-        if isinstance(other, Colour):
-            self.red //= other.red
-            self.green //= other.green
-            self.blue //= other.blue
-        elif isinstance(other, (int, float)):
-            self.red = int(self.red // other)
-            self.green = int(self.green // other)
-            self.blue = int(self.blue // other)
+        return self._apply(floordiv, other)
+
+
+class ColourBuffer:
+    """Represents the colours of a run of RGB lights.
+
+    The red, green, and blue components of every colour are each stored in
+    their own plane of bytes, so an operation on the whole buffer is a single
+    byte translation per plane rather than a Python operation per colour.
+    """
+
+    def __init__(self, size: int):
+        """Initialise the buffer with `size` black colours."""
+        self._red = bytearray(size)
+        self._green = bytearray(size)
+        self._blue = bytearray(size)
+
+    def __len__(self) -> int:
+        """Get the number of colours in the buffer."""
+        return len(self._red)
+
+    def __getitem__(self, index: int) -> Colour:
+        """Get a copy of the colour at an index."""
+        return Colour(self._red[index], self._green[index], self._blue[index])
+
+    def __setitem__(self, index: int, colour: Colour):
+        """Set the colour at an index."""
+        self._red[index], self._green[index], self._blue[index] = colour.serialise()
+
+    def fill(self, colour: Colour):
+        """Set every colour in the buffer."""
+        size = len(self)
+        self._red[:] = bytes((colour.red, )) * size
+        self._green[:] = bytes((colour.green, )) * size
+        self._blue[:] = bytes((colour.blue, )) * size
+
+    def _apply(self, operation: Callable[[float, float], float],
+               other: Union[int, float]) -> 'ColourBuffer':
+        """Apply an operation to every component, giving a new clamped buffer."""
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+
+        # There are only 256 possible components, so the operation is worked out
+        # once for each of them and the planes are translated through the table.
+        table = bytes(clamp_byte(operation(value, other)) for value in range(256))
+        result = ColourBuffer(0)
+        result._red = self._red.translate(table)
+        result._green = self._green.translate(table)
+        result._blue = self._blue.translate(table)
+        return result
+
+    def __add__(self, other: Union[int, float]) -> 'ColourBuffer':
+        """Handle add."""
+        return self._apply(add, other)
+
+    def __sub__(self, other: Union[int, float]) -> 'ColourBuffer':
+        """Handle subtract."""
+        return self._apply(sub, other)
+
+    def __mul__(self, other: Union[int, float]) -> 'ColourBuffer':
+        """Handle multiply."""
+        return self._apply(mul, other)
+
+    def __truediv__(self, other: Union[int, float]) -> 'ColourBuffer':
+        """Handle division."""
+        return self._apply(truediv, other)
+
+    def __floordiv__(self, other: Union[int, float]) -> 'ColourBuffer':
+        """Handle floor division."""
+        return self._apply(floordiv, other)
+
+    def serialise(self) -> bytes:
+        """Serialise the buffer in RGB order to a sequence of bytes.
+
+        The colours are laid out one after another, as for consecutive 3 slot
+        lights.
+        """
+        serialised = bytearray(3 * len(self))
+        serialised[0::3] = self._red
+        serialised[1::3] = self._green
+        serialised[2::3] = self._blue
+        return bytes(serialised)
+
+    # Alias of `serialise`.
+    serialize = serialise
+
+    def serialise_into(self,
+                       frame: Union[bytearray, memoryview],
+                       addresses: Sequence[int],
+                       combine: bool = True):
+        """Write each colour into a frame at the address of its light.
+
+        This is the same as `DMXLight.write_into` for a 3 slot light at each
+        address, so the frame is indexed from the first address, slots are ORed
+        with the frame unless `combine` is `False`, slots past the highest
+        address wrap around, and slots past the end of the frame are skipped.
+        """
+        if len(addresses) != len(self):
+            raise ValueError("Expected an address for every colour in the buffer.")
+        if not addresses:
+            return
+
+        frame_size = len(frame)
+        planes = (self._red, self._green, self._blue)
+
+        # Lights spaced evenly through the frame, given as a range, have each
+        # component at a fixed stride so a whole plane is written at once.
+        if (isinstance(addresses, range) and addresses.step >= 3
+                and addresses.start >= DMX_MIN_ADDRESS and addresses[-1] + 2 <= frame_size):
+            first = addresses.start - DMX_MIN_ADDRESS
+            last = addresses[-1] - DMX_MIN_ADDRESS
+            for offset, plane in enumerate(planes):
+                slots = slice(first + offset, last + offset + 1, addresses.step)
+                frame[slots] = bytes(map(or_, frame[slots], plane)) if combine else plane
+            return
+
+        for address, red, green, blue in zip(addresses, *planes):
+            slot = address - DMX_MIN_ADDRESS
+            for value in (red, green, blue):
+                slot %= DMX_MAX_ADDRESS
+                if slot < frame_size:
+                    frame[slot] = frame[slot] | value if combine else value
+                slot += 1
+
+    # Alias of `serialise_into`.
+    serialize_into = serialise_into
 
 
 RED = Colour(255, 0, 0)
@@ -144,3 +267,6 @@ BLACK = Colour(0, 0, 0)
 
 # Alias of `Colour`.
 Color = Colour
+
+# Alias of `ColourBuffer`.
+ColorBuffer = ColourBuffer
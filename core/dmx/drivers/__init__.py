@@ -30,10 +30,19 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from abc import ABC, abstractmethod
+from functools import lru_cache
 from importlib import import_module
-from os import listdir, path, walk
-from typing import Dict, List, Type
+from os import path
+from pkgutil import iter_modules
+from sys import modules
+from typing import Any, Dict, Optional, Type, Union
+
+try:
+    from importlib.metadata import entry_points
+except ImportError:
+    # importlib.metadata was added in Python 3.8, before then drivers are only
+    # found by searching the driver directories.
+    entry_points = None
 
 DMX_DRIVERS_PRESENT = True
 try:
@@ -43,34 +52,48 @@ except ImportError:
     dmx_drivers = None
     DMX_DRIVERS_PRESENT = False
 
-__ALL__ = ["DMXDriver", "get_drivers"]
+__ALL__ = ["DMXDriver", "get_driver", "get_drivers", "invalidate_drivers"]
 
 DRIVER_PATH = path.abspath(path.dirname(__file__))
 
+DRIVER_ENTRY_POINT_GROUP = "dmx.drivers"
+
+
+class DMXDriver:
+    """Represents a DMX driver.
 
-class DMXDriver(ABC):
-    """Represents a DMX driver."""
+    Drivers must override `open`, `close`, `write` and `closed`, the base
+    implementations raise `NotImplementedError`.
+    """
 
-    @abstractmethod
     def __init__(self, *args, **kwargs):
         """Initialise the DMX driver."""
 
-    @abstractmethod
     def open(self):
         """Open the driver."""
+        raise NotImplementedError
 
-    @abstractmethod
     def close(self):
         """Close the driver."""
+        raise NotImplementedError
 
-    @abstractmethod
-    def write(self, data: List[int]):
+    def write(self, data: Union[bytes, bytearray, memoryview]):
         """Write 512 bytes or less of DMX data."""
+        raise NotImplementedError
+
+    def write_buffer(self, data: memoryview):
+        """Write 512 bytes or less of DMX data from a buffer.
+
+        This is what `DMXInterface` calls to send its frame. By default it passes
+        the buffer on to `write`, drivers which can send straight from a buffer
+        should override it to skip any conversion.
+        """
+        self.write(data)
 
     @property
-    @abstractmethod
     def closed(self):
         """Is the driver closed."""
+        raise NotImplementedError
 
     @staticmethod
     def get_driver_name():
@@ -78,8 +101,14 @@ class DMXDriver(ABC):
         return "ABC"
 
 
+@lru_cache(maxsize=1)
 def get_drivers() -> Dict[str, Type[DMXDriver]]:
-    """Get a dictionary of driver names to drivers."""
+    """Get a dictionary of driver names to drivers.
+
+    Discovery walks the driver directories and imports every driver it finds,
+    so the result is cached for the lifetime of the process. Call
+    `invalidate_drivers` if drivers are installed after the first call.
+    """
     drivers = {}
 
     # There are two possible sources of "containers" for drivers, all drivers
@@ -87,27 +116,30 @@ def get_drivers() -> Dict[str, Type[DMXDriver]]:
     driver_containers = [DRIVER_PATH]
     if DMX_DRIVERS_PRESENT and hasattr(dmx_drivers, "__path__"):
         for driver_path in dmx_drivers.__path__:
-            driver_containers += [path.join(driver_path, x) for x in listdir(driver_path)]
+            driver_containers += [
+                path.join(driver_path, name)
+                for _, name, ispkg in iter_modules([driver_path])
+                if ispkg
+            ]
 
     # We go through each container, looking for drivers...
     for driver_container in driver_containers:
-        # Drivers must be in their own files, so we look based on files...
-        for driver_file in listdir(driver_container):
-            container_name = path.basename(driver_container)
-            driver_full_path = path.join(driver_container, driver_file)
-
-            # We make the assumption that all drivers are .py and not in __xxx__ files.
-            if (path.isfile(driver_full_path) and driver_file.endswith(".py")
-                    and not driver_file.startswith("__")):
-                driver_name, *_ = path.splitext(driver_file)
+        container_name = path.basename(driver_container)
 
+        # Drivers must be in their own modules, so we look based on modules...
+        for _, driver_name, ispkg in iter_modules([driver_container]):
+            # We make the assumption that drivers are not packages or __xxx__ modules.
+            if not ispkg and not driver_name.startswith("__"):
                 # We try to import the driver here, just in case it's not actually a driver.
                 try:
                     from_package = "dmx.drivers"
                     if container_name != "drivers":
                         from_package = "dmx_drivers." + container_name
 
-                    driver_module = import_module("." + str(driver_name), from_package)
+                    # Skip the import machinery for drivers which are already loaded.
+                    driver_module = modules.get(from_package + "." + driver_name)
+                    if driver_module is None:
+                        driver_module = import_module("." + driver_name, from_package)
                 except ImportError:
                     continue  # there's an error in the driver, continue.
 
@@ -116,4 +148,51 @@ def get_drivers() -> Dict[str, Type[DMXDriver]]:
                     driver_class = getattr(driver_module, "DRIVER_CLASS")
                     drivers[driver_class.get_driver_name()] = driver_class
 
+    # Drivers can also be registered as entry points, which lets them live
+    # outside of the driver directories.
+    for driver_name, entry_point in _get_driver_entry_points().items():
+        if driver_name not in drivers:
+            try:
+                drivers[driver_name] = entry_point.load()
+            except ImportError:
+                continue  # there's an error in the driver, continue.
+
     return drivers
+
+
+@lru_cache(maxsize=1)
+def _get_driver_entry_points() -> Dict[str, Any]:
+    """Get a dictionary of driver names to their (unloaded) entry points."""
+    if entry_points is None:
+        return {}
+
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, "select"):
+        driver_entry_points = all_entry_points.select(group=DRIVER_ENTRY_POINT_GROUP)
+    else:
+        # Before Python 3.10 entry points are a dictionary keyed on group.
+        driver_entry_points = all_entry_points.get(DRIVER_ENTRY_POINT_GROUP, ())
+
+    return {entry_point.name: entry_point for entry_point in driver_entry_points}
+
+
+def get_driver(driver_name: str) -> Optional[Type[DMXDriver]]:
+    """Get a driver by name, or `None` if there is no driver with that name.
+
+    Drivers registered as entry points in the "dmx.drivers" group are imported
+    on their own, other drivers are found using `get_drivers`.
+    """
+    entry_point = _get_driver_entry_points().get(driver_name)
+    if entry_point is not None:
+        try:
+            return entry_point.load()
+        except ImportError:
+            pass
+
+    return get_drivers().get(driver_name)
+
+
+def invalidate_drivers():
+    """Clear the cached drivers so the next call to `get_drivers` searches again."""
+    get_drivers.cache_clear()
+    _get_driver_entry_points.cache_clear()
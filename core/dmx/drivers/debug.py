@@ -30,95 +30,147 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import sys
+from bisect import bisect_right
+from collections import deque
 from time import time_ns
-from typing import List, Optional
+from typing import Deque, List, Optional, Union
 
 from dmx.drivers import DMXDriver
 from dmx.light import DMXLight
 from dmx.universe import DMXUniverse
 
+# Two digit hex for every byte value, to avoid formatting each byte on every write.
+_HEX_BYTES = ["{:02x}".format(value) for value in range(256)]
+
 
 class Debug(DMXDriver):
     """Debug DMX driver class."""
 
+    _SEPARATOR = "-" * 40
+
     def __init__(self,
                  dmx_universe: Optional[DMXUniverse] = None,
-                 dmx_lights: Optional[List[DMXLight]] = None):
-        """Initialise the DMX driver."""
+                 dmx_lights: Optional[List[DMXLight]] = None,
+                 verbose: bool = True):
+        """Initialise the DMX driver.
+
+        If a universe is given, each write prints the lights the universe has
+        at the time, including lights added after the driver is initialised.
+
+        If `verbose` is `False` only the frame dumps are printed, messages about
+        the state of the driver are not.
+        """
         if dmx_universe is None and dmx_lights is None:
             raise Exception("Please pass in either dmx_universe or dmx_lights to the interface.")
-        if dmx_universe is not None:
-            self._lights = dmx_universe.get_lights()
-        if dmx_lights is not None:
-            self._lights = set(dmx_lights)
+        # A universe already keeps its lights sorted by start address, so it is
+        # kept and its lights are printed as they are on each write.
+        self._universe = dmx_universe if dmx_lights is None else None
+        # Lights passed on their own are kept sorted by start address so each
+        # write can print them in order without sorting them again, the start
+        # addresses are kept alongside so lights can be added in order with a
+        # binary search.
+        self._lights = sorted(dmx_lights or (), key=lambda x: x.start_address)
+        self._start_addresses = [light.start_address for light in self._lights]
         self._closed = True
-        self._last_write = 0
-        self._last_frequency = 0.0
-        print("Driver initialised")
+        self._write_times = deque(maxlen=16)  # type: Deque[int]
+        self._verbose = verbose
+        if verbose:
+            print("Driver initialised")
+
+    def add_light(self, light: DMXLight):
+        """Add a light to be printed on each write.
+
+        If the driver was given a universe the light is added to the universe.
+        """
+        if self._universe is not None:
+            self._universe.add_light(light)
+            return
+        index = bisect_right(self._start_addresses, light.start_address)
+        self._lights.insert(index, light)
+        self._start_addresses.insert(index, light.start_address)
 
-    def write(self, data: List[int]):
+    def remove_light(self, light: DMXLight):
+        """Remove a light from those printed on each write.
+
+        If the driver was given a universe the light is removed from the universe.
+        """
+        if self._universe is not None:
+            self._universe.remove_light(light)
+            return
+        index = self._lights.index(light)
+        del self._lights[index]
+        del self._start_addresses[index]
+
+    def write(self, data: Union[bytes, bytearray, memoryview]):
         """Write 512 bytes or less of DMX data.
 
         Parameters
         ----------
-        data: List[int]
-            a list of up to 512 values between 0 and 255 (inclusive).
+        data: Union[bytes, bytearray, memoryview]
+            a bytes-like object of up to 512 values between 0 and 255 (inclusive).
 
         """
         if self.closed:
-            print("Write to closed interface.")
+            if self._verbose:
+                print("Write to closed interface.")
             return
 
         time_current = time_ns()
 
-        print("-" * 40)
-        print("Data write start")
-        print("-" * 40)
-        for light in sorted(self._lights, key=lambda x: x.start_address):
-            print("{:03}-{:03} | {}".format(light.start_address, light.end_address,
-                                            " ".join("{:02x}".format(x)
-                                                     for x in light.serialise())))
-        print("-" * 40)
-        print("Data write end")
-
-        time_last = self._last_write
-        time_difference = time_current - time_last
-        frequency = 1000000000 / time_difference
-
-        if self._last_frequency != 0.0:
-            frequency = (self._last_frequency + frequency) / 2.0
-
-        if self._last_write == 0:
-            print("No estimate on first message.")
+        # The whole dump is built up and written at once rather than printed a
+        # line at a time.
+        separator = Debug._SEPARATOR
+        lines = [separator, "Data write start", separator]
+
+        # The per light loop runs for every light on every write, so the
+        # functions it uses are bound to locals once up front.
+        append_line = lines.append
+        format_line = "{:03}-{:03} | {}".format
+        join_bytes = " ".join
+        hex_byte = _HEX_BYTES.__getitem__
+        lights = self._lights if self._universe is None else self._universe.get_sorted_lights()
+        for light in lights:
+            append_line(
+                format_line(light.start_address, light.end_address,
+                            join_bytes(map(hex_byte, light.serialise()))))
+        lines += [separator, "Data write end"]
+
+        # The estimate is the mean rate over the most recent writes.
+        write_times = self._write_times
+        write_times.append(time_current)
+        if len(write_times) < 2:
+            lines.append("No estimate on first message.")
         else:
-            print("Write frequency estimate is {:.3} hrz".format(frequency))
-
-        print("-" * 40)
+            frequency = (len(write_times) - 1) * 1000000000 / (write_times[-1] - write_times[0])
+            lines.append("Write frequency estimate is {:.3} hrz".format(frequency))
 
-        if self._last_write != 0:
-            self._last_frequency = frequency
-        self._last_write = time_current
+        lines.append(separator)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def open(self):
         """Open the driver."""
-        print("Driver opened")
+        if self._verbose:
+            print("Driver opened")
         self._closed = False
 
     def close(self):
         """Close the driver."""
-        print("Driver closed")
+        if self._verbose:
+            print("Driver closed")
         self._closed = True
 
     @property
     def closed(self) -> bool:
         """Is the driver closed."""
-        print("Driver status checked, status was {}".format("closed" if self._closed else "open"))
+        if self._verbose:
+            print("Driver status checked, status was {}".format(
+                "closed" if self._closed else "open"))
         return self._closed
 
     @staticmethod
     def get_driver_name() -> str:
         """Get the driver name."""
-        print("Driver name checked")
         return "Debug"
 
 
@@ -30,7 +30,7 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import List
+from typing import Union
 
 from dmx.drivers import DMXDriver
 
@@ -42,13 +42,23 @@ class Dummy(DMXDriver):
         """Initialise the DMX driver."""
         self._closed = True
 
-    def write(self, data: List[int]):
+    def write(self, data: Union[bytes, bytearray, memoryview]):
         """Write 512 bytes or less of DMX data.
 
         Parameters
         ----------
-        data: List[int]
-            a list of up to 512 values between 0 and 255 (inclusive).
+        data: Union[bytes, bytearray, memoryview]
+            a bytes-like object of up to 512 values between 0 and 255 (inclusive).
+
+        """
+
+    def write_buffer(self, data: memoryview):
+        """Write 512 bytes or less of DMX data from a buffer.
+
+        Parameters
+        ----------
+        data: memoryview
+            a buffer of up to 512 bytes.
 
         """
 
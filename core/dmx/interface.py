@@ -30,10 +30,25 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Union
+from weakref import finalize
 
 from dmx.constants import DMX_MAX_ADDRESS
-from dmx.drivers import DMXDriver, get_drivers
+from dmx.drivers import DMXDriver, get_driver
+from dmx.light import DMXLight
+
+# A view of an all zero frame, slices of which are copied to clear the frame.
+_EMPTY_FRAME = memoryview(bytes(DMX_MAX_ADDRESS))
+
+
+def _close_device(device: DMXDriver):
+    """Close a device if it is open, used to close the device of a disposed interface."""
+    try:
+        if not device.closed:
+            device.close()
+    except Exception:
+        # the driver may already be partly torn down, which doesn't matter here
+        pass
 
 
 class DMXInterface:
@@ -42,16 +57,22 @@ class DMXInterface:
     def __init__(self, driver_name: str, *args, **kwards):
         """Initialise the DMX interface."""
         self._device = None  #  type: Optional[DMXDriver]
-        self._frame_state = []  # type: List[int]
-        self.clear_state()
+        # the frame is preallocated once and updated in place, a DMX slot is a
+        # single byte so a bytearray is the natural (and compact) fit
+        self._frame_state = bytearray(DMX_MAX_ADDRESS)
+        self._frame_view = memoryview(self._frame_state)
+        self._lights = []  # type: List[DMXLight]
         self._set_device_driver(driver_name, *args, **kwards)
 
     def _set_device_driver(self, driver_name: str, *args, **kwards):
         """Set driver to specified driver."""
-        drivers = get_drivers()
-        if driver_name in drivers:
-            driver = drivers[driver_name]
+        driver = get_driver(driver_name)
+        if driver is not None:
             self._device = driver(*args, **kwards)
+            # a finaliser rather than __del__ closes the device once the
+            # interface is disposed, it only holds the device so it doesn't
+            # keep the interface alive
+            self._finalizer = finalize(self, _close_device, self._device)
         else:
             raise Exception("Unknown driver")
 
@@ -68,26 +89,41 @@ class DMXInterface:
         """Open interface."""
         self._device.open()
 
+    def register_lights(self, lights: Iterable[DMXLight]):
+        """Register lights to be written straight into the frame on each update.
+
+        While lights are registered, `send_update` builds the frame from them,
+        replacing any frame set with `set_frame`. Registering an empty iterable
+        returns to sending the frame set with `set_frame`.
+        """
+        self._lights = list(lights)
+
     def send_update(self):
         """Send an update on the interface."""
-        if self._device is not None and not self._device.closed:
-            self._device.write(self._frame_state)
+        device = self._device
+        if not device.closed:
+            if self._lights:
+                self.clear_state()
+                for light in self._lights:
+                    light.write_into(self._frame_state)
+            device.write_buffer(self._frame_view)
 
-    def set_frame(self, frame: List[int]):
+    def set_frame(self, frame: Union[bytes, bytearray, List[int]]):
         """Set the current state of the next DMX frame to be sent on the interface."""
-        if self._device is not None and not self._device.closed:
-            self._frame_state = frame[:DMX_MAX_ADDRESS] + ([0] * (DMX_MAX_ADDRESS - len(frame)))
+        frame_length = len(frame)
+        if frame_length > DMX_MAX_ADDRESS:
+            frame_length = DMX_MAX_ADDRESS
+            frame = frame[:DMX_MAX_ADDRESS]
+        # frames which fit are copied straight in, without slicing them first
+        self._frame_state[:frame_length] = frame
+        self._frame_state[frame_length:] = _EMPTY_FRAME[frame_length:]
 
     def clear_state(self):
         """Clear the state of the next DMX frame."""
-        self._frame_state = [0] * DMX_MAX_ADDRESS
+        self._frame_state[:] = _EMPTY_FRAME
 
     def close(self):
         """Close the interface."""
-        if self._device is not None and not self._device.closed:
-            self._device.close()
-
-    def __del__(self):
-        """Try and close the driver if this object is disposed."""
-        if self._device is not None and hasattr(self._device, "closed") and not self._device.closed:
-            self._device.close()
+        device = self._device
+        if not device.closed:
+            device.close()
@@ -30,28 +30,101 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from abc import ABC, abstractmethod
-from typing import List
+from operator import or_
+from typing import Optional, Sequence, Tuple, Union
 
 from dmx.colour import BLACK, Colour
 from dmx.constants import DMX_MAX_ADDRESS, DMX_MIN_ADDRESS
+from dmx.util import clamp_byte
 
 
-class DMXLight(ABC):
-    """Represents a DMX light."""
+def _or_into(frame: Union[bytearray, memoryview], start: int, slots: Sequence[int]):
+    """OR slots into a frame from an index, skipping any past the end of the frame."""
+    end = min(start + len(slots), len(frame))
+    if end > start:
+        frame[start:end] = bytes(map(or_, frame[start:end], slots))
+
+
+def _copy_into(frame: Union[bytearray, memoryview], start: int, slots: Sequence[int]):
+    """Copy slots into a frame from an index, skipping any past the end of the frame."""
+    end = min(start + len(slots), len(frame))
+    if end > start:
+        frame[start:end] = bytes(slots[:end - start])
+
+
+class DMXLight:
+    """Represents a DMX light.
+
+    Lights must override `serialise` and `slot_count`, the base `serialise`
+    raises `NotImplementedError`.
+    """
+
+    # The number of slots used by this light.
+    slot_count = 0
 
     def __init__(self, address: int = 1):
         """Initialise the light. The base initialiser simply stores the address."""
         self._address = int(max(0, min(address, DMX_MAX_ADDRESS)))
-
-    @abstractmethod
-    def serialise(self) -> List[int]:
+        # the address and slot count of a light don't change, so the derived
+        # addresses and runs of slots in a frame are worked out on first use
+        # and then kept
+        self._end_address = None  # type: Optional[int]
+        self._highest_address = None  # type: Optional[int]
+        self._runs = None  # type: Optional[Tuple[Tuple[int, int, int], ...]]
+
+    def serialise(self) -> bytes:
         """Serialise the DMX light to a sequence of bytes."""
+        raise NotImplementedError
 
-    def serialize(self, *args, **kwargs) -> List[int]:
+    def serialize(self, *args, **kwargs) -> bytes:
         """Alias of `serialise`."""
         return self.serialise(*args, **kwargs)
 
+    def write_into(self, frame: Union[bytearray, memoryview], combine: bool = True):
+        """Write the light's slots into a frame.
+
+        The frame is indexed from the first address, so address 1 is index 0.
+        Slots are ORed with the existing content of the frame, or replace it if
+        `combine` is `False`, slots past the highest address wrap around to the
+        lowest, and slots which fall beyond the end of the frame are skipped.
+        """
+        self._write_serialised(frame, self.serialise(), combine)
+
+    def _write_serialised(self,
+                          frame: Union[bytearray, memoryview],
+                          serialised_light: Sequence[int],
+                          combine: bool = True):
+        """Write a serialisation of the light into a frame, as `write_into`."""
+        runs = self._runs
+        if runs is None:
+            runs = self._runs = self._get_runs()
+
+        write = _or_into if combine else _copy_into
+        for start, slots_start, slots_end in runs:
+            write(frame, start, serialised_light[slots_start:slots_end])
+
+    def _get_runs(self) -> Tuple[Tuple[int, int, int], ...]:
+        """Get the runs of slots the light writes into a frame.
+
+        Each run is the index in the frame the run starts at, and the start and
+        end of the run in the light's slots.
+        """
+        slot_count = self.slot_count
+        start = self._address - DMX_MIN_ADDRESS
+        if start < 0:
+            # the address is clamped to at least 0, which is the slot just
+            # before the lowest address, i.e. the highest address
+            start += DMX_MAX_ADDRESS
+
+        # a light wraps at most once, so its slots are the run up to the highest
+        # address followed by any remaining run from the lowest address
+        wrap_count = start + slot_count - DMX_MAX_ADDRESS
+        if wrap_count <= 0:
+            # the common case, the light doesn't wrap so its slots are one run
+            return ((start, 0, slot_count), )
+        head_count = slot_count - wrap_count
+        return ((start, 0, head_count), (0, head_count, slot_count))
+
     @property
     def start_address(self) -> int:
         """Start address (inclusive) of the light."""
@@ -60,37 +133,34 @@ class DMXLight(ABC):
     @property
     def end_address(self) -> int:
         """End address (inclusive) of the light."""
-        end_address = self._address + self.slot_count - 1
-        if end_address > DMX_MAX_ADDRESS or end_address < DMX_MIN_ADDRESS:
-            return ((end_address - DMX_MIN_ADDRESS) % DMX_MAX_ADDRESS) + DMX_MIN_ADDRESS
-        return end_address
+        if self._end_address is None:
+            end_address = self._address + self.slot_count - 1
+            if end_address > DMX_MAX_ADDRESS or end_address < DMX_MIN_ADDRESS:
+                end_address = ((end_address - DMX_MIN_ADDRESS) % DMX_MAX_ADDRESS) + DMX_MIN_ADDRESS
+            self._end_address = end_address
+        return self._end_address
 
     @property
     def highest_address(self) -> int:
         """Highest address used by this light."""
-        if self.end_address < self.start_address:
-            return DMX_MAX_ADDRESS
-        return self.end_address
-
-    @property
-    def slot_count(self) -> int:
-        """Get the number of slots used by this light."""
-        return 0
+        if self._highest_address is None:
+            if self.end_address < self.start_address:
+                self._highest_address = DMX_MAX_ADDRESS
+            else:
+                self._highest_address = self.end_address
+        return self._highest_address
 
 
 class DMXLight3Slot(DMXLight):
     """Represents a DMX light with RGB."""
 
+    slot_count = 3
+
     def __init__(self, address: int = 1):
         """Initialise the light."""
         super().__init__(address=address)
         self._colour = BLACK
 
-    @property
-    def slot_count(self) -> int:
-        """Get the number of slots used by this light."""
-        return 3
-
     def set_colour(self, colour: Colour):
         """Set the colour for the light."""
         self._colour = colour
@@ -99,7 +169,7 @@ class DMXLight3Slot(DMXLight):
         """Alias for `set_colour`."""
         self.set_colour(*args, **kwargs)
 
-    def serialise(self) -> List[int]:
+    def serialise(self) -> bytes:
         """Serialise the DMX light to a sequence of bytes."""
         return self._colour.serialise()
 
@@ -107,28 +177,51 @@ class DMXLight3Slot(DMXLight):
 class DMXLight7Slot(DMXLight3Slot):
     """Represents an DMX light with RGB, rotation, and opacity."""
 
+    slot_count = 7
+
     def __init__(self, address: int = 1):
         """Initialise the light."""
         super().__init__(address=address)
-        self._opacity = 255
-        self._coords = (0, 0, 0)
+        # slots are laid out as red, green, blue, pitch, roll, yaw, opacity and
+        # updated in place by the setters, the colour slots are filled in when
+        # serialising as the colour may have changed since it was set
+        self._slots = bytearray(7)
+        self._slots[6] = 255
+        # the last serialisation, and the colour bytes it was made from, which
+        # are reused until a setter runs or the colour serialises differently
+        self._serialised = None  # type: Optional[bytes]
+        self._serialised_colour = None  # type: Optional[bytes]
 
     def set_rotation(self, pitch: int, roll: int, yaw: int):
         """Set the rotation of the light, each value between 0 and 255 (inclusive)."""
-        pitch = int(max(0, min(pitch, 255)))
-        roll = int(max(0, min(roll, 255)))
-        yaw = int(max(0, min(yaw, 255)))
-        self._coords = (pitch, roll, yaw)
+        slots = self._slots
+        try:
+            # in range integers can be stored as they are, anything else makes
+            # the bytearray raise and is clamped instead
+            slots[3] = pitch
+            slots[4] = roll
+            slots[5] = yaw
+        except (TypeError, ValueError):
+            slots[3] = clamp_byte(pitch)
+            slots[4] = clamp_byte(roll)
+            slots[5] = clamp_byte(yaw)
+        self._serialised = None
 
     def set_opacity(self, value: int):
         """Set the opacity of the light between 0 and 255 (inclusive)."""
-        self._opacity = int(max(0, min(value, 255)))
-
-    @property
-    def slot_count(self) -> int:
-        """Get the number of slots used by this light."""
-        return 7
+        try:
+            self._slots[6] = value
+        except (TypeError, ValueError):
+            self._slots[6] = clamp_byte(value)
+        self._serialised = None
 
-    def serialise(self) -> List[int]:
+    def serialise(self) -> bytes:
         """Serialise the DMX light to a sequence of bytes."""
-        return super().serialise() + list(self._coords) + [self._opacity]
+        # colours return the same bytes object until they change, so an identity
+        # check is enough to tell if the colour slots are still up to date
+        colour_slots = super().serialise()
+        if self._serialised is None or colour_slots is not self._serialised_colour:
+            self._slots[0:3] = colour_slots
+            self._serialised = bytes(self._slots)
+            self._serialised_colour = colour_slots
+        return self._serialised
@@ -30,35 +30,64 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Iterator, List, Set
+from bisect import bisect_right
+from operator import is_
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
-from dmx.constants import DMX_EMPTY_BYTE, DMX_MAX_ADDRESS, DMX_MIN_ADDRESS
+from dmx.constants import DMX_MAX_ADDRESS, DMX_MIN_ADDRESS
 from dmx.light import DMXLight
 
 
-def _circular_range(start: int, stop: int, modulo: int) -> Iterator[int]:
-    """A circular range from start to stop mod some value."""
-    counter = start
-    while counter != stop and counter < modulo:
-        yield counter
-        counter = (counter + 1) % modulo
-
-
 class DMXUniverse:
     """Represents a DMX universe."""
 
     def __init__(self, universe_id: int = 1):
         """Initialise the DMX universe."""
+        # lights are iterated in address order using the list, which is kept
+        # sorted with a binary search over the parallel list of start
+        # addresses, the set is kept for membership checks and for get_lights
         self._lights = set()  # type: Set[DMXLight]
+        self._light_list = []  # type: List[DMXLight]
+        self._start_addresses = []  # type: List[int]
+        # the highest address of each light is kept alongside the lights so a
+        # partial frame can be sized without visiting every light
+        self._highest_addresses = {}  # type: Dict[DMXLight, int]
+        # the bound write_into of each light, in order, built on first use and
+        # kept until the lights change as most universes are set up once and
+        # then serialised for every frame
+        self._writers = None  # type: Optional[Tuple[Callable[..., None], ...]]
+        # the last full frame and the serialisations of the lights it was built
+        # from, while the lights keep returning the same serialisations the
+        # frame is reused rather than built again
+        self._frame = None  # type: Optional[bytes]
+        self._frame_serialisations = []  # type: List[bytes]
+        # whether any lights share a slot, worked out when a frame is built
+        # after the lights change
+        self._overlapping = None  # type: Optional[bool]
         self._id = universe_id
 
     def add_light(self, light: DMXLight):
         """Add a light to the universe."""
-        self._lights.add(light)
+        if light not in self._lights:
+            self._lights.add(light)
+            index = bisect_right(self._start_addresses, light.start_address)
+            self._light_list.insert(index, light)
+            self._start_addresses.insert(index, light.start_address)
+            self._writers = None
+            self._frame = None
+            self._overlapping = None
+        self._highest_addresses[light] = light.highest_address
 
     def remove_light(self, light: DMXLight):
         """Remove a light from the universe."""
         self._lights.remove(light)
+        index = self._light_list.index(light)
+        del self._light_list[index]
+        del self._start_addresses[index]
+        del self._highest_addresses[light]
+        self._writers = None
+        self._frame = None
+        self._overlapping = None
 
     def has_light(self, light: DMXLight) -> bool:
         """Check if the universe has a light."""
@@ -68,13 +97,33 @@ class DMXUniverse:
         """Get all lights in this universe."""
         return self._lights
 
-    def serialise(self, partial: bool = False) -> List[int]:
+    def get_sorted_lights(self) -> Sequence[DMXLight]:
+        """Get all lights in this universe, sorted by start address."""
+        return self._light_list
+
+    def serialise(self, partial: bool = False, max_address: Optional[int] = None) -> List[int]:
         """Serialise all the content of the DMX universe.
 
         Creates a frame which will update all lights to their current state.
 
         If `partial` is `True` then only up to the highest light address in the
-        `Universe` will be serialised.
+        `Universe` will be serialised. If `max_address` is given then nothing
+        past that address will be serialised, and lights which only use higher
+        addresses are skipped.
+        """
+        return list(self.serialise_bytes(partial=partial, max_address=max_address))
+
+    # Alias of `serialise`.
+    serialize = serialise
+
+    def serialise_bytes(self,
+                        partial: bool = False,
+                        max_address: Optional[int] = None) -> bytearray:
+        """Serialise all the content of the DMX universe as bytes.
+
+        As `serialise`, but the frame is returned as it was built rather than
+        converted to a list, ready to be passed to `DMXInterface.set_frame` or a
+        driver.
         """
         # assume by default that we want to send a whole frame even if we don't
         # have lights configured in some sections of it
@@ -83,37 +132,97 @@ class DMXUniverse:
         # if we only send what we need to (e.g. partially send the frame) we
         # have to work out how big the frame should be ahead of time
         if partial:
-            if self._lights:
-                # addresses are 1-indexed so the lowest address is 1 and the
-                # highest is 512, as such we don't need to add one to size here
-                # for it to get the frame size right
-                frame_size = max(light.highest_address for light in self._lights)
-            else:
-                frame_size = 0
+            # addresses are 1-indexed so the lowest address is 1 and the highest
+            # is 512, as such we don't need to add one to size here for it to
+            # get the frame size right
+            frame_size = max(self._highest_addresses.values(), default=0)
+
+        if max_address is None:
+            # a partial frame is the start of a full frame, as the frame size
+            # covers every light's highest address
+            frame = bytearray(self._full_frame())
+            del frame[frame_size:]
+            return frame
+
+        frame_size = max(0, min(frame_size, max_address))
+        frame = bytearray(frame_size)
+        for light in self._light_list:
+            # a light starting past the end of the frame can still reach it if
+            # it wraps around to the lowest address
+            if light.start_address <= frame_size or light.end_address < light.start_address:
+                light.write_into(frame)
+        return frame
 
-        frame = [DMX_EMPTY_BYTE] * frame_size
+    # Alias of `serialise_bytes`.
+    serialize_bytes = serialise_bytes
+
+    def _full_frame(self) -> bytes:
+        """Get a full frame of all the lights, reusing the last if no light has changed."""
+        # lights return the same bytes object until they change, so if every
+        # light returns the object it did for the last frame that frame is
+        # still correct
+        serialisations = [light.serialise() for light in self._light_list]
+        frame = self._frame
+        if frame is None or not all(map(is_, serialisations, self._frame_serialisations)):
+            if self._overlapping is None:
+                self._overlapping = self._lights_overlap()
+            # the frame starts empty, so unless lights share slots each slot is
+            # only written once and can be copied rather than ORed
+            new_frame = bytearray(DMX_MAX_ADDRESS)
+            # the lights were just serialised, so those serialisations are
+            # written rather than serialising every light again
+            for light, serialisation in zip(self._light_list, serialisations):
+                light._write_serialised(new_frame, serialisation, self._overlapping)
+            frame = bytes(new_frame)
+            # other sequences could be changed in place, so can't be relied on
+            if all(type(serialisation) is bytes for serialisation in serialisations):
+                self._frame = frame
+                self._frame_serialisations = serialisations
+            else:
+                self._frame = None
+        return frame
 
-        for light in self._lights:
-            serialised_light = light.serialise()
+    def _lights_overlap(self) -> bool:
+        """Check if any lights in the universe share a slot."""
+        used = bytearray(DMX_MAX_ADDRESS)
+        for light in self._light_list:
+            start = light.start_address - DMX_MIN_ADDRESS
+            for index in range(start, start + light.slot_count):
+                index %= DMX_MAX_ADDRESS
+                if used[index]:
+                    return True
+                used[index] = 1
+        return False
+
+    def write_into(self, frame: Union[bytearray, memoryview], combine: bool = True):
+        """Write all the lights in the universe into a frame.
+
+        Slots are ORed with the existing content of the frame, or replace it if
+        `combine` is `False`, see `DMXLight.write_into`.
+        """
+        writers = self._writers
+        if writers is None:
+            writers = self._writers = tuple(light.write_into for light in self._light_list)
 
-            # translate to zero-indexed ranges for modular range
-            zero_indexed_range_start = light.start_address - DMX_MIN_ADDRESS
-            zero_indexed_range_end = light.end_address
+        # each light writes (and wraps) its slots into the frame directly
+        for write_into in writers:
+            write_into(frame, combine)
 
-            for index, address in enumerate(
-                    _circular_range(zero_indexed_range_start, zero_indexed_range_end,
-                                    DMX_MAX_ADDRESS)):
-                # back to real DMX address which is one-indexed
-                address += DMX_MIN_ADDRESS
 
-                if partial and len(frame) < address:
-                    frame.extend([DMX_EMPTY_BYTE] * (address - len(frame)))
+def serialise_universes(universes: Sequence[DMXUniverse]) -> bytearray:
+    """Serialise several DMX universes into one buffer of back to back frames.
 
-                # the index here is a counter for the light's internet
-                frame[address - DMX_MIN_ADDRESS] |= serialised_light[index]
+    Each universe gets a full frame, so the frame for the universe at index `i`
+    starts at `i * DMX_MAX_ADDRESS`.
+    """
+    frames = bytearray(len(universes) * DMX_MAX_ADDRESS)
+    # views of the one buffer let each universe write in place without copying
+    with memoryview(frames) as view:
+        for index, universe in enumerate(universes):
+            offset = index * DMX_MAX_ADDRESS
+            universe.write_into(view[offset:offset + DMX_MAX_ADDRESS])
+    return frames
 
-        return frame
 
-    def serialize(self, *args, **kwargs) -> List[int]:
-        """Alias of `serialise`."""
-        return self.serialise(*args, **kwargs)
+# Alias of `serialise_universes`.
+serialize_universes = serialise_universes
@@ -0,0 +1,155 @@
+"""PyDMX Colour Unit Tests."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jacob Allen
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from dmx.colour import Colour, ColourBuffer
+from dmx.light import DMXLight3Slot
+from dmx.universe import DMXUniverse
+
+
+class TestColour(unittest.TestCase):
+    """Test Colour class."""
+
+    def test_components(self) -> None:
+        """Test component getters."""
+        colour = Colour(1, 2, 3)
+
+        self.assertEqual((colour.red, colour.green, colour.blue), (1, 2, 3))
+
+    def test_serialise(self) -> None:
+        """Test colour serialisation."""
+        colour = Colour(1, 2, 3)
+
+        self.assertEqual(colour.serialise(), bytes([1, 2, 3]))
+
+    def test_components_are_clamped(self) -> None:
+        """Test components given at initialisation are clamped."""
+        colour = Colour(-5, 2.5, 300)
+
+        self.assertEqual((colour.red, colour.green, colour.blue), (0, 2, 255))
+        self.assertEqual(colour.serialise(), bytes([0, 2, 255]))
+
+    def test_infinite_components_are_clamped(self) -> None:
+        """Test infinite components saturate rather than failing to convert."""
+        self.assertEqual(Colour(float("inf"), float("-inf"), 0).serialise(), bytes([255, 0, 0]))
+        self.assertEqual((Colour(1, 2, 3) * float("inf")).serialise(), bytes([255, 255, 255]))
+
+    def test_nan_components_are_clamped(self) -> None:
+        """Test NaN components are clamped to 0."""
+        self.assertEqual(Colour(float("nan"), 2, 3).serialise(), bytes([0, 2, 3]))
+        self.assertEqual((Colour(1, 2, 3) * float("nan")).serialise(), bytes([0, 0, 0]))
+        colours = ColourBuffer(1)
+        colours.fill(Colour(1, 2, 3))
+        self.assertEqual((colours * float("nan")).serialise(), bytes([0, 0, 0]))
+
+    def test_serialise_after_set(self) -> None:
+        """Test serialisation reflects components set after a previous serialisation."""
+        colour = Colour(1, 2, 3)
+        colour.serialise()
+        colour.blue = 300
+
+        self.assertEqual(colour.serialise(), bytes([1, 2, 255]))
+
+    def test_arithmetic(self) -> None:
+        """Test arithmetic gives a new clamped colour."""
+        colour = Colour(10, 20, 30)
+
+        self.assertEqual((colour + Colour(1, 240, 3)).serialise(), bytes([11, 255, 33]))
+        self.assertEqual((colour - 15).serialise(), bytes([0, 5, 15]))
+        self.assertEqual((colour * 0.5).serialise(), bytes([5, 10, 15]))
+        self.assertEqual((colour / Colour(3, 3, 3)).serialise(), bytes([3, 6, 10]))
+        self.assertEqual(colour.serialise(), bytes([10, 20, 30]))
+
+
+class TestColourBuffer(unittest.TestCase):
+    """Test ColourBuffer class."""
+
+    def test_serialise(self) -> None:
+        """Test colour buffer serialisation."""
+        colours = ColourBuffer(3)
+        colours[0] = Colour(1, 2, 3)
+        colours[2] = Colour(4, 5, 6)
+
+        self.assertEqual(colours.serialise(), bytes([1, 2, 3, 0, 0, 0, 4, 5, 6]))
+
+    def test_get_colour(self) -> None:
+        """Test getting a colour from a colour buffer."""
+        colours = ColourBuffer(2)
+        colours[1] = Colour(1, 2, 3)
+
+        self.assertEqual(colours[1].serialise(), bytes([1, 2, 3]))
+
+    def test_fill(self) -> None:
+        """Test filling a colour buffer."""
+        colours = ColourBuffer(2)
+        colours.fill(Colour(1, 2, 3))
+
+        self.assertEqual(colours.serialise(), bytes([1, 2, 3, 1, 2, 3]))
+
+    def test_arithmetic(self) -> None:
+        """Test arithmetic on a whole colour buffer."""
+        colours = ColourBuffer(2)
+        colours[0] = Colour(10, 100, 200)
+        colours[1] = Colour(0, 1, 255)
+        scaled = colours * 1.5
+
+        self.assertEqual(scaled.serialise(), bytes([15, 150, 255, 0, 1, 255]))
+        self.assertEqual(colours.serialise(), bytes([10, 100, 200, 0, 1, 255]))
+
+    def test_serialise_into_universe_frame(self) -> None:
+        """Test writing a colour buffer into a frame matches a universe of its lights."""
+        for addresses in (range(1, 31, 3), range(2, 40, 4), [5, 1, 511, 512, 0]):
+            colours = ColourBuffer(len(addresses))
+            universe = DMXUniverse()
+            for index, address in enumerate(addresses):
+                colour = Colour(index + 1, 2 * index + 1, 255 - index)
+                colours[index] = colour
+                light = DMXLight3Slot(address=address)
+                light.set_colour(colour)
+                universe.add_light(light)
+            frame = bytearray(512)
+
+            colours.serialise_into(frame, addresses)
+
+            self.assertEqual(frame, universe.serialise_bytes())
+
+    def test_serialise_into_without_combining(self) -> None:
+        """Test writing a colour buffer into a frame replacing what is already there."""
+        colours = ColourBuffer(2)
+        colours.fill(Colour(1, 2, 3))
+        frame = bytearray([8] * 8)
+
+        colours.serialise_into(frame, range(2, 6, 3), combine=False)
+        colours.serialise_into(frame, [7, 0], combine=False)
+
+        self.assertEqual(list(frame), [2, 3, 2, 3, 1, 2, 1, 2])
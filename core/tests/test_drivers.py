@@ -0,0 +1,107 @@
+"""PyDMX Driver Discovery Unit Tests."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jacob Allen
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import contextlib
+import io
+import unittest
+
+from dmx.drivers import get_driver, get_drivers, invalidate_drivers
+from dmx.drivers.debug import Debug
+from dmx.drivers.dummy import Dummy
+from dmx.light import DMXLight3Slot
+from dmx.universe import DMXUniverse
+
+
+class TestDriverDiscovery(unittest.TestCase):
+    """Test driver discovery."""
+
+    def test_bundled_drivers_are_found(self) -> None:
+        """Test the drivers that come with PyDMX are found."""
+        drivers = get_drivers()
+        self.assertIs(drivers["Debug"], Debug)
+        self.assertIs(drivers["Dummy"], Dummy)
+
+    def test_drivers_are_cached(self) -> None:
+        """Test repeated discovery returns the cached result."""
+        self.assertIs(get_drivers(), get_drivers())
+
+    def test_invalidate_drivers(self) -> None:
+        """Test invalidating drivers searches again."""
+        drivers = get_drivers()
+        invalidate_drivers()
+        self.assertIsNot(get_drivers(), drivers)
+        self.assertEqual(get_drivers(), drivers)
+
+    def test_unknown_driver(self) -> None:
+        """Test an unknown driver name gives None."""
+        self.assertIsNone(get_driver("NotADriver"))
+
+
+class TestDebugDriver(unittest.TestCase):
+    """Test the Debug driver."""
+
+    def _write(self, driver: Debug) -> str:
+        """Write an empty frame with a driver and get what was printed."""
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            driver.write(bytes(512))
+        return output.getvalue()
+
+    def test_universe_lights_added_later_are_printed(self) -> None:
+        """Test lights added to the universe after the driver is created are printed."""
+        universe = DMXUniverse()
+        universe.add_light(DMXLight3Slot(address=10))
+        driver = Debug(dmx_universe=universe, verbose=False)
+        driver.open()
+        universe.add_light(DMXLight3Slot(address=1))
+
+        output = self._write(driver)
+
+        self.assertLess(output.index("001-003"), output.index("010-012"))
+
+    def test_lights_are_printed_in_order(self) -> None:
+        """Test lights passed on their own are printed in address order."""
+        driver = Debug(dmx_lights=[DMXLight3Slot(address=10)], verbose=False)
+        driver.open()
+        driver.add_light(DMXLight3Slot(address=1))
+
+        output = self._write(driver)
+
+        self.assertLess(output.index("001-003"), output.index("010-012"))
+
+    def test_quiet_when_not_verbose(self) -> None:
+        """Test a driver that isn't verbose prints nothing but frame dumps."""
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            driver = Debug(dmx_lights=[], verbose=False)
+            driver.write(bytes(512))
+            Debug.get_driver_name()
+
+        self.assertEqual(output.getvalue(), "")
@@ -0,0 +1,106 @@
+"""PyDMX Interface Unit Tests."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jacob Allen
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gc
+import unittest
+from unittest import mock
+
+from dmx.colour import Colour
+from dmx.drivers.dummy import Dummy
+from dmx.interface import DMXInterface
+from dmx.light import DMXLight3Slot
+
+
+class TestDMXInterface(unittest.TestCase):
+    """Test DMX Interface class."""
+
+    def test_short_frame_is_padded(self) -> None:
+        """Test a short frame is padded with zeros."""
+        with DMXInterface("Dummy") as interface, mock.patch.object(Dummy, "write_buffer") as write:
+            interface.set_frame([1, 2, 3])
+            interface.send_update()
+
+            self.assertEqual(list(write.call_args[0][0]), [1, 2, 3] + ([0] * 509))
+
+    def test_long_frame_is_truncated(self) -> None:
+        """Test a frame longer than a universe is truncated."""
+        with DMXInterface("Dummy") as interface, mock.patch.object(Dummy, "write_buffer") as write:
+            interface.set_frame([7] * 600)
+            interface.send_update()
+
+            self.assertEqual(list(write.call_args[0][0]), [7] * 512)
+
+    def test_set_frame_clears_previous_frame(self) -> None:
+        """Test setting a shorter frame clears the tail of the previous one."""
+        with DMXInterface("Dummy") as interface, mock.patch.object(Dummy, "write_buffer") as write:
+            interface.set_frame([9] * 512)
+            interface.set_frame([1])
+            interface.send_update()
+
+            self.assertEqual(list(write.call_args[0][0]), [1] + ([0] * 511))
+
+    def test_clear_state(self) -> None:
+        """Test clearing the frame state."""
+        with DMXInterface("Dummy") as interface, mock.patch.object(Dummy, "write_buffer") as write:
+            interface.set_frame([9] * 512)
+            interface.clear_state()
+            interface.send_update()
+
+            self.assertEqual(list(write.call_args[0][0]), [0] * 512)
+
+    def test_registered_lights(self) -> None:
+        """Test registered lights are written into the frame on update."""
+        light = DMXLight3Slot(address=2)
+        light.set_colour(Colour(1, 2, 3))
+
+        with DMXInterface("Dummy") as interface, mock.patch.object(Dummy, "write_buffer") as write:
+            interface.set_frame([9] * 512)
+            interface.register_lights([light])
+            interface.send_update()
+
+            self.assertEqual(list(write.call_args[0][0]), [0, 1, 2, 3] + ([0] * 508))
+
+    def test_unknown_driver(self) -> None:
+        """Test an unknown driver name is rejected."""
+        with self.assertRaises(Exception):
+            DMXInterface("Unknown")
+
+    def test_disposed_interface_closes_device(self) -> None:
+        """Test the device is closed once an open interface is disposed."""
+        interface = DMXInterface("Dummy")
+        interface.open()
+        device = interface._device
+
+        del interface
+        gc.collect()
+
+        self.assertTrue(device.closed)
@@ -0,0 +1,151 @@
+"""PyDMX Light Unit Tests."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jacob Allen
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from dmx.colour import Colour
+from dmx.light import DMXLight3Slot, DMXLight7Slot
+
+
+class TestDMXLight3Slot(unittest.TestCase):
+    """Test DMX 3 slot light class."""
+
+    def test_serialise(self) -> None:
+        """Test 3 slot light serialisation."""
+        light = DMXLight3Slot()
+        light.set_colour(Colour(1, 2, 3))
+
+        self.assertEqual(light.serialise(), bytes([1, 2, 3]))
+
+
+class TestDMXLight7Slot(unittest.TestCase):
+    """Test DMX 7 slot light class."""
+
+    def test_default_serialise(self) -> None:
+        """Test default 7 slot light serialisation."""
+        light = DMXLight7Slot()
+
+        self.assertEqual(light.serialise(), bytes([0, 0, 0, 0, 0, 0, 255]))
+
+    def test_serialise(self) -> None:
+        """Test 7 slot light serialisation."""
+        light = DMXLight7Slot()
+        light.set_colour(Colour(1, 2, 3))
+        light.set_rotation(4, -5, 600)
+        light.set_opacity(7)
+
+        self.assertEqual(light.serialise(), bytes([1, 2, 3, 4, 0, 255, 7]))
+
+    def test_serialise_follows_colour(self) -> None:
+        """Test 7 slot light serialisation reflects changes to its colour."""
+        colour = Colour(1, 2, 3)
+        light = DMXLight7Slot()
+        light.set_colour(colour)
+        light.serialise()
+        colour.green = 20
+
+        self.assertEqual(light.serialise(), bytes([1, 20, 3, 0, 0, 0, 255]))
+
+    def test_serialise_after_set(self) -> None:
+        """Test 7 slot light serialisation reflects setters called after serialising."""
+        light = DMXLight7Slot()
+        light.serialise()
+        light.set_rotation(1, 2, 3)
+        light.set_opacity(4)
+
+        self.assertEqual(light.serialise(), bytes([0, 0, 0, 1, 2, 3, 4]))
+
+    def test_set_clamps(self) -> None:
+        """Test out of range and non-integer rotation and opacity are clamped."""
+        light = DMXLight7Slot()
+        light.set_rotation(-5, 2.7, 300)
+        light.set_opacity(1000)
+
+        self.assertEqual(light.serialise(), bytes([0, 0, 0, 0, 2, 255, 255]))
+
+    def test_set_nan_clamps(self) -> None:
+        """Test NaN rotation and opacity are clamped to 0."""
+        light = DMXLight7Slot()
+        light.set_rotation(1, float("nan"), 3)
+        light.set_opacity(float("nan"))
+
+        self.assertEqual(light.serialise(), bytes([0, 0, 0, 1, 0, 3, 0]))
+
+    def test_write_into(self) -> None:
+        """Test writing a 7 slot light into a frame."""
+        light = DMXLight7Slot(address=3)
+        light.set_colour(Colour(1, 2, 3))
+        frame = bytearray(12)
+
+        light.write_into(frame)
+
+        self.assertEqual(list(frame), [0, 0, 1, 2, 3, 0, 0, 0, 255, 0, 0, 0])
+
+    def test_write_into_without_combining(self) -> None:
+        """Test writing a light into a frame replacing what is already there."""
+        light = DMXLight3Slot(address=2)
+        light.set_colour(Colour(1, 2, 3))
+        frame = bytearray([8, 8, 8, 8, 8])
+
+        light.write_into(frame, combine=False)
+
+        self.assertEqual(list(frame), [8, 1, 2, 3, 8])
+
+    def test_write_into_wraps(self) -> None:
+        """Test writing a 7 slot light past the highest address into a frame."""
+        light = DMXLight7Slot(address=510)
+        light.set_colour(Colour(1, 2, 3))
+        frame = bytearray(512)
+
+        light.write_into(frame)
+
+        self.assertEqual(list(frame), [0, 0, 0, 255] + ([0] * 505) + [1, 2, 3])
+
+    def test_write_into_address_zero(self) -> None:
+        """Test writing a light at address 0 starts at the highest address."""
+        light = DMXLight3Slot(address=0)
+        light.set_colour(Colour(1, 2, 3))
+        frame = bytearray(512)
+
+        light.write_into(frame)
+
+        self.assertEqual(list(frame), [2, 3] + ([0] * 509) + [1])
+
+    def test_write_into_short_frame(self) -> None:
+        """Test writing a 7 slot light into a frame which ends part way through it."""
+        light = DMXLight7Slot(address=2)
+        light.set_colour(Colour(1, 2, 3))
+        frame = bytearray([8, 8, 8])
+
+        light.write_into(frame)
+
+        self.assertEqual(list(frame), [8, 9, 10])
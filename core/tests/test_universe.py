@@ -32,9 +32,11 @@
 
 import unittest
 from typing import List
+from unittest import mock
 
-from dmx.light import DMXLight
-from dmx.universe import DMXUniverse
+from dmx.colour import Colour
+from dmx.light import DMXLight, DMXLight3Slot, DMXLight7Slot
+from dmx.universe import DMXUniverse, serialise_universes
 
 
 class _Light(DMXLight):
@@ -102,3 +104,110 @@ class TestDMXUniverse(unittest.TestCase):
 
         self.assertEqual(universe.serialise(partial=True),
                          [3, 4, 5, 6, 7, 8, 9, 10] + ([0] * 502) + [1, 2])
+
+    def test_add_light_twice(self) -> None:
+        """Test adding the same light twice only serialises it once."""
+        universe = DMXUniverse()
+        light = _Light(address=1)
+        universe.add_light(light)
+        universe.add_light(light)
+
+        self.assertEqual(universe.serialise(partial=True), [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+
+    def test_remove_light(self) -> None:
+        """Test removed lights are not serialised."""
+        universe = DMXUniverse()
+        light = _Light(address=1)
+        universe.add_light(light)
+        universe.remove_light(light)
+
+        self.assertFalse(universe.has_light(light))
+        self.assertEqual(universe.serialise(), [0] * 512)
+
+    def test_lights_changed_after_serialise(self) -> None:
+        """Test lights added or removed after serialising are picked up."""
+        universe = DMXUniverse()
+        light = _Light(address=1)
+        universe.serialise()
+
+        universe.add_light(light)
+        self.assertEqual(universe.serialise(partial=True), light.slot_values)
+
+        universe.remove_light(light)
+        self.assertEqual(universe.serialise(), [0] * 512)
+
+    def test_serialise_bytes(self) -> None:
+        """Test universe serialisation as bytes."""
+        universe = DMXUniverse()
+        light = _Light(address=2)
+        universe.add_light(light)
+
+        self.assertEqual(universe.serialise_bytes(partial=True),
+                         bytearray([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
+
+    def test_serialise_universes(self) -> None:
+        """Test serialising several universes into one buffer."""
+        first = DMXUniverse()
+        first.add_light(_Light(address=510))
+        second = DMXUniverse()
+        second.add_light(_Light(address=5))
+
+        frames = serialise_universes([first, second])
+
+        self.assertEqual(len(frames), 2 * 512)
+        self.assertEqual(frames[:512], first.serialise_bytes())
+        self.assertEqual(frames[512:], second.serialise_bytes())
+
+    def test_serialise_max_address(self) -> None:
+        """Test universe serialisation up to a maximum address."""
+        universe = DMXUniverse()
+        universe.add_light(_Light(address=1))
+        universe.add_light(_Light(address=100))
+        universe.add_light(_Light(address=510))
+
+        self.assertEqual(universe.serialise(max_address=12),
+                         [5, 7, 7, 7, 13, 15, 15, 8, 9, 10, 0, 0])
+        self.assertEqual(universe.serialise(max_address=12), universe.serialise()[:12])
+        self.assertEqual(universe.serialise(partial=True, max_address=600),
+                         universe.serialise(partial=True))
+
+    def test_changed_lights_reserialised(self) -> None:
+        """Test lights changed after serialising are picked up."""
+        universe = DMXUniverse()
+        light = DMXLight3Slot(address=1)
+        light_7_slot = DMXLight7Slot(address=4)
+        universe.add_light(light)
+        universe.add_light(light_7_slot)
+        frame = universe.serialise_bytes(partial=True)
+        frame[0] = 9  # changing a returned frame doesn't change the next one
+
+        self.assertEqual(universe.serialise_bytes(partial=True),
+                         bytearray([0, 0, 0, 0, 0, 0, 0, 0, 0, 255]))
+
+        light.set_colour(Colour(1, 2, 3))
+        light_7_slot.set_opacity(4)
+
+        self.assertEqual(universe.serialise_bytes(partial=True),
+                         bytearray([1, 2, 3, 0, 0, 0, 0, 0, 0, 4]))
+
+    def test_overlapping_lights(self) -> None:
+        """Test lights which share slots are ORed together."""
+        universe = DMXUniverse()
+        universe.add_light(_Light(address=1))
+        universe.add_light(_Light(address=3))
+
+        self.assertEqual(universe.serialise(partial=True),
+                         [1, 2, 3 | 1, 4 | 2, 5 | 3, 6 | 4, 7 | 5, 8 | 6, 9 | 7, 10 | 8, 9, 10])
+
+    def test_lights_serialised_once_per_frame(self) -> None:
+        """Test building a frame serialises each light once."""
+        universe = DMXUniverse()
+        light = DMXLight3Slot(address=1)
+        universe.add_light(light)
+        serialise = light.serialise
+        with mock.patch.object(light, "serialise", side_effect=serialise) as serialised:
+            light.set_colour(Colour(1, 2, 3))
+
+            self.assertEqual(universe.serialise_bytes(partial=True), bytearray([1, 2, 3]))
+
+        self.assertEqual(serialised.call_count, 1)
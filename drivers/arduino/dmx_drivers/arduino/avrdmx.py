@@ -30,15 +30,21 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from math import ceil
 from platform import system
-from typing import List, cast
+from struct import Struct
+from typing import List, Union, cast
 from warnings import warn
 
 from serial import Serial
 
 from dmx.drivers import DMXDriver
 
+# The platform doesn't change while running, so it is only checked once.
+_IS_WINDOWS = system() == "Windows"
+
+# Packet headers are the packet type followed by the little-endian length.
+_PACKET_HEADER = Struct("<BH")
+
 
 class ProtocolException(Exception):
     """Generic exception thrown by errors communicating with the device."""
@@ -51,7 +57,7 @@ class EncodingException(Exception):
 class AVRDMX(DMXDriver):
     """A DMX driver design for an Arduino based interface."""
 
-    DEFAULT_DEVICE = "COM3" if system() == "Windows" else "/dev/ttyACM0"
+    DEFAULT_DEVICE = "COM3" if _IS_WINDOWS else "/dev/ttyACM0"
 
     class BaudratePreset:
         """Enumeration of baudrate presets."""
@@ -60,7 +66,7 @@ class AVRDMX(DMXDriver):
         NORMAL_SPEED = 115200
         SAFE_HIGH_SPEED = 230400
         HIGH_SPEED = 460800
-        DEFAULT = SAFE_HIGH_SPEED if system() == "Windows" else HIGH_SPEED
+        DEFAULT = SAFE_HIGH_SPEED if _IS_WINDOWS else HIGH_SPEED
 
     class _ProtocolKey:
         """Enumeration of protocol types."""
@@ -110,6 +116,24 @@ class AVRDMX(DMXDriver):
 
         _ENCODINGS = (RAW, RLE, BP1, BP2, BP4, SUM, SRE, TCZ)
 
+    # Tables mapping each byte value to the nearest value at a bit depth. This
+    # is round((value / 0xff) * max_value) in integer arithmetic, which never
+    # lands exactly between two values so always agrees with round.
+    _QUANTISATION_TABLES = {
+        bit_depth: bytes([(value * (2**bit_depth - 1) + 0x7f) // 0xff for value in range(0x100)])
+        for bit_depth in (1, 2, 4, 8)
+    }
+
+    # Messages for the error codes the AVRDMX sends after an error byte.
+    _ERROR_MESSAGES = {
+        0x00: "Null error.",
+        0x01: "Incorrect handshake first prompt.",
+        0x02: "Incorrect handshake second prompt.",
+        0x03: "Read timed-out before completion of packet header.",
+        0x04: "Received too much data. This is unlikely without memory corruption.",
+        0x05: "Read timed-out, not enough data received. Packet length might have been wrong?",
+    }
+
     def __init__(self,
                  device=DEFAULT_DEVICE,
                  baudrate=BaudratePreset.DEFAULT,
@@ -130,10 +154,12 @@ class AVRDMX(DMXDriver):
         """
         self._device = device
         self._baudrate = baudrate
-        if system() == "Windows" and self._baudrate > 230400:
+        if _IS_WINDOWS and self._baudrate > 230400:
             warn("Setting baudrate to above 230400 baud has been found to cause issues on Windows.")
         self._serial = None
         self._closed = True
+        # Buffer for packets with a header, a control code, and up to 512 bytes.
+        self._packet = bytearray(_PACKET_HEADER.size + 1 + 512)
         if encoding not in AVRDMX.Encoding._ENCODINGS:
             raise EncodingException("Encoding not recognised, choose one of: '{}'.".format(
                 "', '".join(AVRDMX.Encoding._ENCODINGS)))
@@ -174,7 +200,7 @@ class AVRDMX(DMXDriver):
         baudrate_bytes = [(new_baudrate >> 24) & 0xff, (new_baudrate >> 16) & 0xff,
                           (new_baudrate >> 8) & 0xff, new_baudrate & 0xff]
 
-        if system() == "Windows":
+        if _IS_WINDOWS:
             # Windows is slow so it gets it's own way to change baudrate
             set_br_control_code = AVRDMX._ControlCode.SET_BR_SLOW
         else:
@@ -200,14 +226,14 @@ class AVRDMX(DMXDriver):
             self._handle_error(response)
 
     def _write_raw(self,
-                   data: List[int],
+                   data: Union[bytes, bytearray, memoryview, List[int]],
                    packet_type: bytes = _PacketType.RAW_PACKET,
                    control_code: bytes = _ControlCode.NONE):
         """Write data without any wrapping.
 
         Parameters
         ----------
-        data: List[int]
+        data: Union[bytes, bytearray, memoryview, List[int]]
             The up to 512 values between 0 and 255 (inclusive) to send.
 
         packet_type: bytes
@@ -219,7 +245,6 @@ class AVRDMX(DMXDriver):
             Defaults to _ControlCode.NONE or 0x00.
 
         """
-        byte_data = bytes(data)
         if isinstance(packet_type, int):
             packet_type_bytes = bytes([packet_type])
         else:
@@ -230,14 +255,19 @@ class AVRDMX(DMXDriver):
         if response != AVRDMX._ProtocolKey.READY_FOR_PACKET:
             self._handle_error(response)
 
-        byte_data = control_code + byte_data
-
-        length = len(byte_data)
+        # The packet is a header followed by the control code and data.
+        # It is assembled in a buffer kept for the purpose rather than by
+        # concatenating (and so copying) the data for each part of the packet.
+        data_start = _PACKET_HEADER.size + len(control_code)
+        data_end = data_start + len(data)
+        packet = self._packet if data_end <= len(self._packet) else bytearray(data_end)
 
-        length = length & 0xffff
-        header = packet_type_bytes + bytes([length & 0xff, (length >> 8) & 0xff])
+        length = (data_end - _PACKET_HEADER.size) & 0xffff
+        _PACKET_HEADER.pack_into(packet, 0, packet_type_bytes[0], length)
+        packet[_PACKET_HEADER.size:data_start] = control_code
+        packet[data_start:data_end] = data
 
-        self._serial.write(header + byte_data)
+        self._serial.write(memoryview(packet)[:data_end])
 
         response = self._serial.read(1)
 
@@ -254,12 +284,12 @@ class AVRDMX(DMXDriver):
             if response != AVRDMX._ProtocolKey.SENT:
                 self._handle_error(response)
 
-    def _encoding_xbp(self, data: List[int], bit_depth: int) -> List[int]:
+    def _encoding_xbp(self, data: Union[bytes, bytearray, memoryview], bit_depth: int) -> bytes:
         """Encode data at a specified bit depth.
 
         Parameters
         ----------
-        data: List[int]
+        data: Union[bytes, bytearray, memoryview]
             The data to encode.
 
         bit_depth: int
@@ -267,26 +297,35 @@ class AVRDMX(DMXDriver):
 
         Returns
         -------
-        encoded_data: List[Int]
+        encoded_data: bytes
             The encoded data packed back into bytes.
 
         """
         values_per_byte = 8 // bit_depth
-        output_data = [0] * ceil((len(data)) / float(values_per_byte))
-        for index, value in enumerate(data):
-            out_index = index // values_per_byte
-            out_value = round((value / 0xff) * (2**bit_depth - 1))
-            bit_offset = index % values_per_byte
-            output_data[out_index] |= (out_value & (2**bit_depth - 1)) << (bit_depth * bit_offset)
-        return output_data
-
-    def write(self, data: List[int]):
+
+        # Pad the data to a whole number of output bytes.
+        data = bytes(data)
+        data += bytes(-len(data) % values_per_byte)
+
+        quantised = data.translate(AVRDMX._QUANTISATION_TABLES[bit_depth])
+
+        # Each lane is every nth value, which all go to the same bits of their
+        # output bytes. Treating a lane as one big integer lets it be shifted
+        # into place and ORed with the others at once, and as every shifted
+        # value still fits in a byte no bits carry over into the next byte.
+        packed = 0
+        for lane in range(values_per_byte):
+            lane_values = int.from_bytes(quantised[lane::values_per_byte], "little")
+            packed |= lane_values << (bit_depth * lane)
+        return packed.to_bytes(len(data) // values_per_byte, "little")
+
+    def write(self, data: Union[bytes, bytearray, memoryview]):
         """Write 512 bytes or less of DMX data.
 
         Parameters
         ----------
-        data: List[int]
-            a list of up to 512 values between 0 and 255 (inclusive).
+        data: Union[bytes, bytearray, memoryview]
+            a bytes-like object of up to 512 values between 0 and 255 (inclusive).
 
         Notes
         -----
@@ -323,23 +362,10 @@ class AVRDMX(DMXDriver):
             error_code = self._serial.read(1)
             self.close()
             # Decode error code.
-            if error_code == 0x00:
-                raise ProtocolException("Null error.")
-            elif error_code == 0x01:
-                raise ProtocolException("Incorrect handshape first prompt.")
-            elif error_code == 0x02:
-                raise ProtocolException("Incorrect handshake second prompt.")
-            elif error_code == 0x03:
-                raise ProtocolException("Read timed-out before completion of packet header.")
-            elif error_code == 0x04:
-                raise ProtocolException(
-                    "Received too much data. This is unlikely without memory corruption.")
-            elif error_code == 0x05:
-                raise ProtocolException(
-                    "Read timed-out, not enough data received. Packet length might have been wrong?"
-                )
-            else:
+            message = AVRDMX._ERROR_MESSAGES.get(error_code[0]) if error_code else None
+            if message is None:
                 raise ProtocolException("Unknown error with code: 0x{}.".format(error_code.hex()))
+            raise ProtocolException(message)
         # If we received a non-error byte which was unexpected at this time.
         else:
             raise ProtocolException("Unexpected response first byte 0x{}.".format(first_byte.hex()))
@@ -0,0 +1,162 @@
+"""PyDMX AVRDMX Driver Unit Tests."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jacob Allen
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import importlib
+import sys
+import types
+import unittest
+from unittest import mock
+
+READY_FOR_PACKET = b'\x44'
+RESPONSE = b'\x33'
+SENDING = b'\x55'
+SENT = b'\x99'
+ERROR = b'\x66'
+
+
+class _Serial:
+    """Stand-in for `serial.Serial` that replays responses and records writes."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.written = []
+        self.closed = False
+
+    def read(self, _size):
+        return self.responses.pop(0) if self.responses else b''
+
+    def write(self, data):
+        self.written.append(bytes(data))
+
+    def close(self):
+        self.closed = True
+
+
+def _import_avrdmx():
+    """Import the driver against a stand-in for pyserial."""
+    serial = types.ModuleType("serial")
+    serial.Serial = _Serial
+    with mock.patch.dict(sys.modules, {"serial": serial}):
+        sys.modules.pop("dmx_drivers.arduino.avrdmx", None)
+        return importlib.import_module("dmx_drivers.arduino.avrdmx")
+
+
+class TestAVRDMX(unittest.TestCase):
+    """Test AVRDMX driver."""
+
+    def setUp(self) -> None:
+        """Import the driver."""
+        self.avrdmx = _import_avrdmx()
+
+    def _driver(self, encoding, responses):
+        """Create a driver with a serial connection which gives the responses."""
+        driver = self.avrdmx.AVRDMX(encoding=encoding)
+        driver._serial = _Serial(responses)
+        return driver
+
+    def test_encoding_xbp(self) -> None:
+        """Test values are rounded to the bit depth and packed low bits first."""
+        driver = self._driver(self.avrdmx.AVRDMX.Encoding.RAW, [])
+
+        self.assertEqual(driver._encoding_xbp(bytes([0, 255, 128, 127, 255, 0, 0, 255]), 1),
+                         bytes([0x96]))
+        self.assertEqual(driver._encoding_xbp(bytes([0, 85, 170, 255, 255]), 2),
+                         bytes([0xe4, 0x03]))
+        self.assertEqual(driver._encoding_xbp(bytes([17, 255, 0]), 4), bytes([0xf1, 0x00]))
+        self.assertEqual(driver._encoding_xbp(bytes(), 4), bytes())
+
+    def test_write_raw_packet(self) -> None:
+        """Test a raw packet is the header, control code and data."""
+        driver = self._driver(self.avrdmx.AVRDMX.Encoding.RAW, [READY_FOR_PACKET, SENDING, SENT])
+
+        driver.write(bytes([1, 2, 3]))
+
+        self.assertEqual(driver._serial.written, [bytes([0x00, 0x04, 0x00, 0x00, 1, 2, 3])])
+
+    def test_write_raw_packet_length(self) -> None:
+        """Test a full raw packet gives its length little-endian."""
+        driver = self._driver(self.avrdmx.AVRDMX.Encoding.RAW, [READY_FOR_PACKET, SENDING, SENT])
+
+        driver.write([7] * 512)
+
+        self.assertEqual(driver._serial.written, [bytes([0x00, 0x01, 0x02, 0x00] + [7] * 512)])
+
+    def test_write_encoded_packet(self) -> None:
+        """Test an encoded packet has its packet type and the encoded data."""
+        driver = self._driver(self.avrdmx.AVRDMX.Encoding.TWO_BIT,
+                              [READY_FOR_PACKET, SENDING, SENT])
+
+        driver.write(bytes([0, 85, 170, 255]))
+
+        self.assertEqual(driver._serial.written, [bytes([0x04, 0x02, 0x00, 0x00, 0xe4])])
+
+    def test_write_control_packet(self) -> None:
+        """Test a control packet has its control code before the data."""
+        driver = self._driver(self.avrdmx.AVRDMX.Encoding.RAW, [READY_FOR_PACKET, RESPONSE])
+
+        driver.write_control([1, 2, 3, 4], control_code=b'\x21')
+
+        self.assertEqual(driver._serial.written,
+                         [bytes([0xff, 0x05, 0x00, 0x21, 1, 2, 3, 4])])
+
+    def test_known_error(self) -> None:
+        """Test a known error code gives its message and closes the driver."""
+        driver = self._driver(self.avrdmx.AVRDMX.Encoding.RAW, [ERROR, b'\x03'])
+        serial = driver._serial
+
+        with self.assertRaisesRegex(self.avrdmx.ProtocolException,
+                                    "timed-out before completion of packet header"):
+            driver.write(bytes(1))
+        self.assertTrue(serial.closed)
+        self.assertTrue(driver.closed)
+
+    def test_unknown_error(self) -> None:
+        """Test an unknown error code is reported with its code."""
+        driver = self._driver(self.avrdmx.AVRDMX.Encoding.RAW, [ERROR, b'\x42'])
+
+        with self.assertRaisesRegex(self.avrdmx.ProtocolException, "Unknown error with code: 0x42"):
+            driver.write(bytes(1))
+
+    def test_empty_error_read(self) -> None:
+        """Test an error with no code following is reported as unknown."""
+        driver = self._driver(self.avrdmx.AVRDMX.Encoding.RAW, [ERROR])
+
+        with self.assertRaisesRegex(self.avrdmx.ProtocolException,
+                                    r"Unknown error with code: 0x\."):
+            driver.write(bytes(1))
+
+    def test_unexpected_response(self) -> None:
+        """Test an unexpected response byte is reported."""
+        driver = self._driver(self.avrdmx.AVRDMX.Encoding.RAW, [SENT])
+
+        with self.assertRaisesRegex(self.avrdmx.ProtocolException, "first byte 0x99"):
+            driver.write(bytes(1))
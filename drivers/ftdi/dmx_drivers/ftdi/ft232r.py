@@ -30,19 +30,22 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from ctypes import c_ubyte
 from os import path
 from platform import system
-from typing import List
+from time import perf_counter_ns, sleep
+from typing import Union
 
-from pylibftdi import Device, Driver, LibraryMissingError
+from pylibftdi import Device, Driver, FtdiError, LibraryMissingError
 
 from dmx.drivers import DMXDriver
 
 DRIVER_PATH = path.abspath(path.dirname(__file__))
 
-if system() == "Linux":
+# The platform doesn't change while running, so it is only checked once.
+_SYSTEM = system()
 
-    from ctypes import cdll, c_long, byref, Structure
+if _SYSTEM == "Linux":
 
     Driver._lib_search["libftdi"] = tuple([
         path.join(DRIVER_PATH, "libftdi.so"),
@@ -50,58 +53,32 @@ if system() == "Linux":
         path.join(DRIVER_PATH, "libftdi1.so")
     ] + list(Driver._lib_search["libftdi"]))
 
-    _LIBC = cdll.LoadLibrary("libc.so.6")
-
-    class timespec(Structure):
-        """A timespec."""
-
-        _fields_ = [("tv_sec", c_long), ("tv_nsec", c_long)]
-
-    def wait_ms(milliseconds):
-        """Wait for a specified number of milliseconds."""
-        dummy = timespec()
-        sleeper = timespec()
-        sleeper.tv_sec = int(milliseconds / 1000)
-        sleeper.tv_nsec = (milliseconds % 1000) * 1000000
-        _LIBC.nanosleep(byref(sleeper), byref(dummy))
-
-    def wait_us(nanoseconds):
-        """Wait for a specified number of nanoseconds."""
-        dummy = timespec()
-        sleeper = timespec()
-        sleeper.tv_sec = int(nanoseconds / 1000000)
-        sleeper.tv_nsec = (nanoseconds % 1000) * 1000
-        _LIBC.nanosleep(byref(sleeper), byref(dummy))
-
-elif system() == "Windows":
-
-    from ctypes import wintypes, windll, byref
-
-    _WIN32 = windll.kernel32
-    _MS = 1000000
-    _INFINITE = 0xFFFFFFFF
-
-    def wait_ms(milliseconds):
-        """Wait for a specified number of milliseconds."""
-        wait_time = wintypes.LARGE_INTEGER(-(_MS * abs(milliseconds)))
-        timer_handle = _WIN32.CreateWaitableTimerW(None, True, None)
-        if timer_handle == 0:
-            raise Exception("CreateWaitableTimerW returned NULL")
-        if _WIN32.SetWaitableTimer(timer_handle, byref(wait_time), 0, None, None, False) == 0:
-            raise Exception("SetWaitableTimer returned 0")
-        _WIN32.WaitForSingleObject(timer_handle, _INFINITE)
-        _WIN32.CloseHandle(timer_handle)
-
-    def wait_us(nanoseconds):
-        """Wait for a specified number of nanoseconds."""
-        wait_time = wintypes.LARGE_INTEGER(-abs(nanoseconds))
-        timer_handle = _WIN32.CreateWaitableTimerW(None, True, None)
-        if timer_handle == 0:
-            raise Exception("CreateWaitableTimerW returned NULL")
-        if _WIN32.SetWaitableTimer(timer_handle, byref(wait_time), 0, None, None, False) == 0:
-            raise Exception("SetWaitableTimer returned 0")
-        _WIN32.WaitForSingleObject(timer_handle, _INFINITE)
-        _WIN32.CloseHandle(timer_handle)
+elif _SYSTEM == "Windows":
+
+    from ctypes import windll
+
+    _WINMM = windll.winmm
+
+
+def wait_ms(milliseconds):
+    """Wait for a specified number of milliseconds."""
+    sleep(milliseconds / 1000)
+
+
+def wait_us(microseconds):
+    """Wait for a specified number of microseconds."""
+    # Sleeps this short are rounded up to the scheduler's resolution, which is
+    # far longer than the wait, so this spins on the clock instead.
+    end = perf_counter_ns() + microseconds * 1000
+    while perf_counter_ns() < end:
+        pass
+
+
+def wait_until(deadline):
+    """Wait until a deadline, in nanoseconds of the performance counter."""
+    remaining = deadline - perf_counter_ns()
+    if remaining > 0:
+        sleep(remaining / 1000000000)
 
 
 class FT232R(Device, DMXDriver):
@@ -112,34 +89,76 @@ class FT232R(Device, DMXDriver):
     _PARITY_NONE = 0
     _BREAK_OFF = 0
     _BREAK_ON = 1
+    _IDLE_NS = 15000000
 
     def __init__(self, device_index=0):
         """Initialise the driver."""
+        # Whether the 1ms timer resolution has been asked for, set before the
+        # device is opened as that happens while initialising the device.
+        self._timer_period = False
         try:
             Device.__init__(self, mode="b", device_index=device_index)
         except LibraryMissingError:
             raise Exception(
                 "Dependency libftdi not found. Check the README for driver dependencies.")
+        # The end of the idle after the last frame, before which the next
+        # frame can't start.
+        self._idle_until = 0
+        # Frames are the start code followed by up to 512 slots, the start code
+        # is always zero so only the slots are written into the buffer.
+        self._frame = (c_ubyte * 513)()
+        self._frame_view = memoryview(self._frame).cast("B")
         self.baudrate = 250000
         self.ftdi_fn.ftdi_set_line_property(FT232R._BITS_8, FT232R._STOP_BITS_2,
                                             FT232R._PARITY_NONE)
 
-    def write(self, data: List[int]):
+    def open(self):
+        """Open the device."""
+        Device.open(self)
+        if _SYSTEM == "Windows" and not self._timer_period:
+            # The default timer resolution on Windows is around 15ms, which is
+            # longer than the break and idle waits, so ask for 1ms while the
+            # device is open.
+            _WINMM.timeBeginPeriod(1)
+            self._timer_period = True
+
+    def close(self):
+        """Close the device."""
+        try:
+            Device.close(self)
+        finally:
+            if self._timer_period:
+                # Every timeBeginPeriod needs a matching timeEndPeriod to
+                # restore the resolution.
+                _WINMM.timeEndPeriod(1)
+                self._timer_period = False
+
+    def write(self, data: Union[bytes, bytearray, memoryview]):
         """Write 512 bytes or less of DMX data."""
+        # The data is copied once, straight into the frame buffer after the
+        # start code, and before the break so it doesn't delay the frame after
+        # the mark.
+        frame_length = 1 + len(data)
         try:
-            byte_data = bytes(data)
+            self._frame_view[1:frame_length] = data
         except TypeError:
-            byte_data = self.encoder.encode(data)
+            # Only bytes-like data can be assigned to the buffer, so anything
+            # else (e.g. a list of ints) is converted first.
+            self._frame_view[1:frame_length] = bytes(data)
+        # Idle, timed from the end of the last frame so that anything done
+        # between writes counts towards it rather than adding to it
+        wait_until(self._idle_until)
         # Break
         self._set_break_on()
         wait_ms(10)
         # Mark after break
         self._set_break_off()
         wait_us(8)
-        # Frame body
-        Device.write(self, b"\x00" + byte_data)
-        # Idle
-        wait_ms(15)
+        # Frame body, written with libftdi directly as Device.write would copy
+        # the frame twice more before writing it.
+        if self.ftdi_fn.ftdi_write_data(self._frame, frame_length) < 0:
+            raise FtdiError(self.get_error_string())
+        self._idle_until = perf_counter_ns() + FT232R._IDLE_NS
 
     def _set_break_on(self):
         self.ftdi_fn.ftdi_set_line_property2(FT232R._BITS_8, FT232R._STOP_BITS_2,
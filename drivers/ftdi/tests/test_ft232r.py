@@ -0,0 +1,108 @@
+"""PyDMX FT232R Driver Unit Tests."""
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jacob Allen
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import importlib
+import sys
+import types
+import unittest
+from unittest import mock
+
+
+class _Device:
+    """Stand-in for `pylibftdi.Device` that records what is written."""
+
+    def __init__(self, *_args, **_kwargs):
+        self.written = []
+        self.ftdi_fn = mock.Mock()
+        self.ftdi_fn.ftdi_write_data.side_effect = self._write_data
+        self.open()
+
+    def open(self):
+        self.opened = True
+
+    def close(self):
+        self.opened = False
+
+    def _write_data(self, frame, length):
+        self.written.append(bytes(frame[:length]))
+        return length
+
+
+def _import_ft232r():
+    """Import the driver against a stand-in for pylibftdi, which needs libftdi."""
+    pylibftdi = types.ModuleType("pylibftdi")
+    pylibftdi.Device = _Device
+    pylibftdi.Driver = mock.Mock(_lib_search={"libftdi": ()})
+    pylibftdi.FtdiError = Exception
+    pylibftdi.LibraryMissingError = Exception
+    with mock.patch.dict(sys.modules, {"pylibftdi": pylibftdi}):
+        sys.modules.pop("dmx_drivers.ftdi.ft232r", None)
+        return importlib.import_module("dmx_drivers.ftdi.ft232r")
+
+
+class TestFT232R(unittest.TestCase):
+    """Test FT232R driver."""
+
+    def setUp(self) -> None:
+        """Create a driver without waiting between frames."""
+        self.ft232r = _import_ft232r()
+        for wait in ("wait_ms", "wait_us", "wait_until"):
+            patcher = mock.patch.object(self.ft232r, wait)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.driver = self.ft232r.FT232R()
+
+    def test_write_bytes(self) -> None:
+        """Test writing bytes sends them after the start code."""
+        self.driver.write(bytes([1, 2, 3]))
+        self.assertEqual(self.driver.written, [bytes([0, 1, 2, 3])])
+
+    def test_write_list(self) -> None:
+        """Test writing a list of ints sends them after the start code."""
+        self.driver.write([1, 2, 3])
+        self.driver.write([255] * 512)
+        self.assertEqual(self.driver.written, [bytes([0, 1, 2, 3]), bytes([0] + [255] * 512)])
+
+    def test_windows_timer_period(self) -> None:
+        """Test the Windows timer resolution is only raised while the device is open."""
+        winmm = mock.Mock()
+        with mock.patch.object(self.ft232r, "_SYSTEM", "Windows"), \
+                mock.patch.object(self.ft232r, "_WINMM", winmm, create=True):
+            driver = self.ft232r.FT232R()
+            driver.open()
+            winmm.timeBeginPeriod.assert_called_once_with(1)
+            winmm.timeEndPeriod.assert_not_called()
+
+            driver.close()
+            driver.close()
+            winmm.timeEndPeriod.assert_called_once_with(1)
+            self.assertFalse(driver.opened)
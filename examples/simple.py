@@ -2,10 +2,12 @@
 """Test script to show how to use module."""
 
 from sys import exit as sys_exit
-from time import sleep
+from time import monotonic_ns, sleep
 
 from dmx import Colour, DMXInterface, DMXLight3Slot, DMXUniverse
 
+UPDATE_PERIOD_NS = 500000000
+
 
 def main():
     """Entry point function."""
@@ -28,12 +30,21 @@ def main():
             random_colour = Colour(0x88, 0x26, 0xff)
             light.set_colour(random_colour)
 
-        # Play lights randomly for a bit
+        # The lights don't change from here on, so the frame only needs to be
+        # serialised once
+        frame = universe.serialise_bytes()
+
+        # Play lights randomly for a bit, pacing updates from a deadline so
+        # the time taken to send each one doesn't add up over the run
+        next_update = monotonic_ns()
         for _ in range(2000):
-            interface.set_frame(universe.serialise())
+            interface.set_frame(frame)
             interface.send_update()
 
-            sleep(0.5 - (15.0 / 1000.0))
+            next_update += UPDATE_PERIOD_NS
+            delay = next_update - monotonic_ns()
+            if delay > 0:
+                sleep(delay / 1000000000)
 
     return 0
 